@@ -14,19 +14,50 @@ Modes:
               consecutiveFailures, i18n keys, CORS proxy compliance
   full        cross-repo + downloadUrl reachability, drift detection,
               registry staleness, CNCF coverage, theme consistency
+
+JSON is parsed (and --json output and the on-disk cache serialized) with
+orjson when it is installed, otherwise with the stdlib.
 """
 
 import argparse
+import bisect
+import functools
 import json
-import glob
+import itertools
 import os
 import re
 import sys
-import urllib.request
-import urllib.error
-from collections import defaultdict
-from datetime import datetime, timezone, timedelta
-from pathlib import Path
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _stdlib_json_loads(data):
+    # Decode bytes as UTF-8 text first, as a text-mode read would (so a
+    # BOM is still an error, as in orjson), then parse with the stdlib
+    return json.loads(data.decode() if isinstance(data, bytes) else data)
+
+
+try:
+    import orjson
+
+    def _json_loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input the stdlib accepts (NaN, Infinity,
+            # integers wider than 64 bits); retry so the verdict does not
+            # depend on whether orjson is installed
+            return _stdlib_json_loads(data)
+
+    def _json_dumps_pretty(obj, sort_keys=False):
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:  # optional accelerator; the stdlib parser is used otherwise
+    _json_loads = _stdlib_json_loads
+
+    def _json_dumps_pretty(obj, sort_keys=False):
+        return json.dumps(obj, indent=2, sort_keys=sort_keys).encode()
 
 # ── Result tracking ──────────────────────────────────────────────────
 
@@ -36,12 +67,18 @@ class Results:
         self.warnings = []
         self.info = []
         self.passes = []
+        # (category, card_type) pairs named by an error/warning's card_type=
+        self.flagged = set()
 
-    def error(self, category, msg):
+    def error(self, category, msg, card_type=None):
         self.errors.append((category, msg))
+        if card_type:
+            self.flagged.add((category, card_type))
 
-    def warn(self, category, msg):
+    def warn(self, category, msg, card_type=None):
         self.warnings.append((category, msg))
+        if card_type:
+            self.flagged.add((category, card_type))
 
     def note(self, category, msg):
         self.info.append((category, msg))
@@ -49,6 +86,14 @@ class Results:
     def ok(self, category, msg):
         self.passes.append((category, msg))
 
+    def merge(self, other):
+        """Append another Results' entries after this one's."""
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.info.extend(other.info)
+        self.passes.extend(other.passes)
+        self.flagged |= other.flagged
+
     @property
     def exit_code(self):
         if self.errors:
@@ -57,41 +102,31 @@ class Results:
             return 2
         return 0
 
+    def _summary_md_lines(self):
+        yield (f"### Marketplace Quality: {len(self.errors)} error(s), "
+               f"{len(self.warnings)} warning(s), {len(self.passes)} passed\n")
+        for title, entries in (("Errors", self.errors), ("Warnings", self.warnings),
+                               ("Info", self.info)):
+            if entries:
+                yield f"\n#### {title}\n"
+                for cat, msg in entries:
+                    yield f"- **[{cat}]** {msg}\n"
+
     def summary_md(self):
-        lines = []
-        total = len(self.errors) + len(self.warnings) + len(self.passes)
-        lines.append(f"### Marketplace Quality: {len(self.errors)} error(s), "
-                     f"{len(self.warnings)} warning(s), {len(self.passes)} passed")
-        lines.append("")
-        if self.errors:
-            lines.append("#### Errors")
-            for cat, msg in self.errors:
-                lines.append(f"- **[{cat}]** {msg}")
-            lines.append("")
-        if self.warnings:
-            lines.append("#### Warnings")
-            for cat, msg in self.warnings:
-                lines.append(f"- **[{cat}]** {msg}")
-            lines.append("")
-        if self.info:
-            lines.append("#### Info")
-            for cat, msg in self.info:
-                lines.append(f"- **[{cat}]** {msg}")
-            lines.append("")
-        return "\n".join(lines)
+        return "".join(self._summary_md_lines())
+
+    def _summary_text(self):
+        for prefix, entries in (("  ERROR [", self.errors), ("  WARN  [", self.warnings),
+                                ("  INFO  [", self.info), ("  OK    [", self.passes)):
+            for cat, msg in entries:
+                yield f"{prefix}{cat}] {msg}\n"
+        yield "\n"
+        yield (f"Result: {len(self.errors)} error(s), {len(self.warnings)} warning(s), "
+               f"{len(self.passes)} passed\n")
 
     def print_summary(self):
-        for cat, msg in self.errors:
-            print(f"  ERROR [{cat}] {msg}")
-        for cat, msg in self.warnings:
-            print(f"  WARN  [{cat}] {msg}")
-        for cat, msg in self.info:
-            print(f"  INFO  [{cat}] {msg}")
-        for cat, msg in self.passes:
-            print(f"  OK    [{cat}] {msg}")
-        print()
-        print(f"Result: {len(self.errors)} error(s), {len(self.warnings)} warning(s), "
-              f"{len(self.passes)} passed")
+        # One write for the whole report — runs can produce thousands of lines
+        sys.stdout.write("".join(self._summary_text()))
 
     def to_json(self):
         return {
@@ -105,49 +140,279 @@ class Results:
 
 # ── JSON file loaders ────────────────────────────────────────────────
 
+# Kinds of marketplace JSON files, as binned by _scan_marketplace():
+#   registry      registry.json
+#   presets       presets/*.json
+#   card-presets  card-presets/*.json
+#   dashboards    dashboards/*/dashboard.json
+#   themes        themes/*.json
+MARKETPLACE_JSON_KINDS = ("registry", "presets", "card-presets", "dashboards", "themes")
+# Top-level directories holding the non-registry kinds (named after them)
+MARKETPLACE_JSON_DIRS = ("presets", "card-presets", "dashboards", "themes")
+
+# The same few hundred paths are resolved by every check; the cwd does not
+# change during a run, so their absolute forms can be memoized
+_abspath = functools.lru_cache(maxsize=None)(os.path.abspath)
+
+# abspath -> (st_mtime_ns, st_size, data, error_msg)
+_JSON_CACHE = {}
+
+
 def load_json(path):
-    """Load and parse a JSON file, return (data, error_msg)."""
+    """Load and parse a JSON file, return (data, error_msg).
+
+    Results are cached per file and reused while its mtime and size are
+    unchanged; most checks read the same presets, dashboards and themes.
+    """
     try:
-        with open(path) as f:
-            return json.load(f), None
-    except json.JSONDecodeError as e:
-        return None, f"Invalid JSON: {e}"
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None, f"File not found: {path}"
+
+    key = _abspath(path)
+    cached = _JSON_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+
+    try:
+        with open(path, "rb") as f:
+            data, err = _json_loads(f.read()), None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data, err = None, f"Invalid JSON: {e}"
     except FileNotFoundError:
         return None, f"File not found: {path}"
 
+    _JSON_CACHE[key] = (st.st_mtime_ns, st.st_size, data, err)
+    return data, err
+
+
+MarketplaceScan = namedtuple("MarketplaceScan", ["bins", "relpaths"])
+
+# abspath(base) -> (scanned dirs, their st_mtime_ns, MarketplaceScan)
+_SCAN_CACHE = {}
+
+
+def _dir_mtimes(dirs):
+    mtimes = []
+    for d in dirs:
+        try:
+            mtimes.append(os.stat(d).st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
 
-def find_json_files(base, patterns):
-    """Find all JSON files matching glob patterns relative to base."""
-    files = []
-    for pat in patterns:
-        files.extend(glob.glob(os.path.join(base, pat), recursive=True))
-    return sorted(set(files))
+def _scan_marketplace(base, revalidate=False):
+    """Walk the marketplace tree once and bin its JSON files by kind.
+
+    Returns a MarketplaceScan whose `bins` map each of MARKETPLACE_JSON_KINDS
+    to a sorted list of (absolute path, path relative to base) pairs, and
+    whose `relpaths` is a frozenset of the same files as '/'-separated
+    relative paths. The result is cached and trusted as is; only with
+    `revalidate` are the scanned directories stat'ed, and the walk redone
+    if one of them has changed. preload_all() revalidates once per run.
+    """
+    base = _abspath(base)
+    cached = _SCAN_CACHE.get(base)
+    if cached and (not revalidate or _dir_mtimes(cached[0]) == cached[1]):
+        return cached[2]
+
+    bins = {kind: [] for kind in MARKETPLACE_JSON_KINDS}
+    scanned = []
+    # Follow symlinked directories as the per-kind globs did; the depth
+    # pruning below keeps a link cycle from recursing.
+    for root, dirs, names in os.walk(base, followlinks=True):
+        scanned.append(root)
+        # os.walk roots are base joined with subdirectory names, so the
+        # relative directory is a plain suffix — no relpath() needed
+        rel_root = root[len(base) + 1:]
+        parts = rel_root.split(os.sep) if rel_root else []
+
+        if not parts:
+            # Only descend into the directories that hold marketplace content
+            dirs[:] = [d for d in dirs if d in MARKETPLACE_JSON_DIRS]
+            if "registry.json" in names:
+                bins["registry"].append((os.path.join(root, "registry.json"), "registry.json"))
+        elif parts[0] == "dashboards" and len(parts) == 1:
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+        elif parts[0] == "dashboards":
+            dirs[:] = []
+            if "dashboard.json" in names:
+                bins["dashboards"].append((os.path.join(root, "dashboard.json"),
+                                           os.path.join(rel_root, "dashboard.json")))
+        else:
+            dirs[:] = []
+            bins[parts[0]].extend((os.path.join(root, n), os.path.join(rel_root, n))
+                                  for n in names
+                                  if n.endswith(".json") and not n.startswith("."))
+
+    for files in bins.values():
+        files.sort()
+
+    relpaths = frozenset(rel.replace(os.sep, "/")
+                         for files in bins.values() for _, rel in files)
+    scan = MarketplaceScan(bins, relpaths)
+    _SCAN_CACHE[base] = (scanned, _dir_mtimes(scanned), scan)
+    return scan
+
+
+def _marketplace_files(base, *kinds):
+    """Sorted (absolute path, relative path) pairs of the marketplace JSON
+    files of the given kinds.
+
+    Each bin is already sorted and lives under its own top-level name, and
+    the kind names sort like those names, so chaining the bins in kind
+    order yields the fully sorted list without another sort or dedupe.
+    """
+    bins = _scan_marketplace(base).bins
+    return list(itertools.chain.from_iterable(bins[kind] for kind in sorted(kinds)))
+
+
+def _marketplace_has_file(relpaths, base, rel):
+    """True if base/rel is a file. Answered from the scan's relpaths when possible."""
+    if rel in relpaths:
+        return True
+    # Not one of the scanned JSON files — it may still exist elsewhere
+    return os.path.isfile(os.path.join(base, rel))
+
+
+def preload_all(base):
+    """Parse every marketplace JSON file once up front to warm the cache.
+
+    Also the one point per run where the cached marketplace scan is
+    checked against the tree; later lookups trust it.
+
+    Deliberately in-process: the whole marketplace parses in a few
+    milliseconds, less than it takes to start a worker process, and the
+    parsed files would have to be pickled back to the parent anyway.
+    """
+    _scan_marketplace(base, revalidate=True)
+    for f, _ in _marketplace_files(base, *MARKETPLACE_JSON_KINDS):
+        load_json(f)
+
+
+# ── On-disk cache (state kept between runs) ─────────────────────────
+
+def _cache_dir():
+    """Per-user cache directory for state kept between validator runs."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "marketplace-validator")
+
+
+def _read_cache_file(name):
+    """Return the parsed JSON cache file `name`, or None if absent/corrupt."""
+    try:
+        with open(os.path.join(_cache_dir(), name), "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_file(name, obj):
+    """Atomically write `obj` as the JSON cache file `name`.
+
+    Best effort — an unwritable cache only makes the next run do the work
+    again.
+    """
+    path = os.path.join(_cache_dir(), name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps_pretty(obj, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
 
 # ── Console source parsers ───────────────────────────────────────────
 
-def parse_card_registry(registry_ts_path):
-    """Extract card type keys from RAW_CARD_COMPONENTS in cardRegistry.ts."""
-    with open(registry_ts_path) as f:
+# const PodIssues = lazy(() => import('./PodIssues'))
+# const DeployStatus = lazy(() => _deployBundle.then(...))
+# Matched per line, as the registry has always been parsed: [^\S\n] and
+# the \n exclusions keep a declaration from matching across a line break.
+_LAZY_RE = re.compile(
+    r"^const (?P<name>\w+)[^\S\n]*=[^\S\n]*lazy\(\(\)[^\S\n]*=>[^\S\n]*"
+    r"(?:import\(['\"]\./(?P<path>[^'\"\n]+)['\"]\)|_(?P<bundle>\w+)\.then\()",
+    re.MULTILINE)
+
+# const _deployBundle = import('./deploy-bundle')
+_BUNDLE_RE = re.compile(r"^const _(\w+)[^\S\n]*=[^\S\n]*import\(['\"]\./([^'\"\n]+)['\"]\)",
+                        re.MULTILINE)
+
+# The RAW_CARD_COMPONENTS = { ... } body: from the line after the first one
+# naming it together with a "{", up to the first line holding only "}" (or
+# end of file).
+_RAW_BLOCK_RE = re.compile(
+    r"^(?=[^\n]*\{)[^\n]*RAW_CARD_COMPONENTS[^\n]*\n(.*?)(?:^[^\S\n]*\}[^\S\n]*$|\Z)",
+    re.MULTILINE | re.DOTALL)
+
+# Block entries: `  pod_issues: PodIssues,`. A key needs whitespace after
+# the colon to count as a card type, and a bare identifier value to map to
+# a component. [^\S\n] keeps matches on one line; `//` comment lines never
+# match since "/" is not a word character.
+_CARD_ENTRY_RE = re.compile(r"^[^\S\n]+(\w+):([^\S\n]*)(\w+)?", re.MULTILINE)
+
+# Match `id: 'card_type',` or `id: "card_type",` — the descriptor
+# registry uses single-quoted string ids on their own line.
+_DESCRIPTOR_ID_RE = re.compile(r"^\s*id:\s*['\"]([\w-]+)['\"]\s*,", re.MULTILINE)
+
+RegistryTS = namedtuple("RegistryTS", ["card_types", "type_to_component", "lazy_imports"])
+
+
+@functools.lru_cache(maxsize=4)
+def _load_registry_ts(path, mtime):
+    """Read and parse cardRegistry.ts once and return a RegistryTS.
+
+    Cached on (path, mtime) so the cross-repo checks, which all need the
+    same three views of the file, share one read and one regex pass.
+    The returned collections are shared between callers — treat them as
+    read-only.
+    """
+    with open(path) as f:
         content = f.read()
 
     card_types = set()
-    in_block = False
-    for line in content.split("\n"):
-        if "RAW_CARD_COMPONENTS" in line and "{" in line:
-            in_block = True
-            continue
-        if in_block and line.strip() == "}":
-            break
-        if in_block:
-            stripped = line.strip()
-            if stripped.startswith("//"):
-                continue
-            m = re.match(r"\s+(\w+):\s", line)
-            if m:
-                card_types.add(m.group(1))
+    mapping = {}
+    block = _RAW_BLOCK_RE.search(content)
+    if block:
+        for m in _CARD_ENTRY_RE.finditer(block.group(1)):
+            key, space, comp = m.groups()
+            if space:
+                card_types.add(key)
+            if comp:
+                mapping[key] = comp
 
-    return card_types
+    bundles = {m.group(1): m.group(2) for m in _BUNDLE_RE.finditer(content)}
+
+    imports = {}
+    bundle_refs = []
+    for m in _LAZY_RE.finditer(content):
+        if m.group("path"):
+            imports[m.group("name")] = m.group("path")
+        else:
+            bundle_refs.append((m.group("name"), m.group("bundle")))
+
+    # Map bundle component names to bundle paths
+    for comp_name, bundle_var in bundle_refs:
+        # Strip "Bundle" suffix if present
+        bundle_key = bundle_var.replace("Bundle", "")
+        if bundle_key in bundles:
+            imports[comp_name] = bundles[bundle_key]
+
+    return RegistryTS(frozenset(card_types), mapping, imports)
+
+
+def _registry_ts(registry_ts_path):
+    """Return the cached RegistryTS for a cardRegistry.ts path."""
+    path = _abspath(registry_ts_path)
+    return _load_registry_ts(path, os.stat(path).st_mtime_ns)
+
+
+def parse_card_registry(registry_ts_path):
+    """Extract card type keys from RAW_CARD_COMPONENTS in cardRegistry.ts."""
+    return _registry_ts(registry_ts_path).card_types
 
 
 def parse_card_descriptors(descriptors_ts_path):
@@ -159,87 +424,40 @@ def parse_card_descriptors(descriptors_ts_path):
     reading this file, cards migrated to the descriptor system appear
     "not found in console registry" even though they are present.
     """
-    if not os.path.isfile(descriptors_ts_path):
-        return set()
-    with open(descriptors_ts_path) as f:
-        content = f.read()
-    # Match `id: 'card_type',` or `id: "card_type",` — the descriptor
-    # registry uses single-quoted string ids on their own line.
-    return set(re.findall(r"^\s*id:\s*['\"]([\w-]+)['\"]\s*,", content, re.MULTILINE))
+    path = _abspath(descriptors_ts_path)
+    try:
+        mtime = os.stat(path).st_mtime_ns  # one stat for both existence and mtime
+    except FileNotFoundError:
+        return frozenset()
+    return _load_card_descriptors(path, mtime)
 
 
-def parse_lazy_imports(registry_ts_path):
-    """Map ComponentName -> import path from lazy() calls."""
-    with open(registry_ts_path) as f:
+@functools.lru_cache(maxsize=4)
+def _load_card_descriptors(path, mtime):
+    """Descriptor ids of cardDescriptors.registry.ts, cached on (path, mtime)."""
+    with open(path) as f:
         content = f.read()
+    return frozenset(_DESCRIPTOR_ID_RE.findall(content))
 
-    imports = {}
-    for line in content.split("\n"):
-        m = re.match(r"const (\w+)\s*=\s*lazy\(\(\)\s*=>\s*import\(['\"]\.\/([^'\"]+)['\"]\)", line)
-        if m:
-            imports[m.group(1)] = m.group(2)
-        # Also handle bundle patterns: lazy(() => _bundle.then(...))
-        m2 = re.match(r"const (\w+)\s*=\s*lazy\(\(\)\s*=>\s*_(\w+)Bundle\.then\(", line)
-        if m2:
-            # These use shared bundles — need the barrel import path
-            pass  # Handled by bundle mapping below
-
-    # Parse bundle imports: const _deployBundle = import('./deploy-bundle')
-    bundles = {}
-    for line in content.split("\n"):
-        m = re.match(r"const _(\w+)\s*=\s*import\(['\"]\.\/([^'\"]+)['\"]\)", line)
-        if m:
-            bundles[m.group(1)] = m.group(2)
 
-    # Map bundle component names to bundle paths
-    for line in content.split("\n"):
-        m = re.match(r"const (\w+)\s*=\s*lazy\(\(\)\s*=>\s*_(\w+)\.then\(", line)
-        if m:
-            comp_name = m.group(1)
-            bundle_var = m.group(2)
-            # Strip "Bundle" suffix if present
-            bundle_key = bundle_var.replace("Bundle", "")
-            if bundle_key in bundles:
-                imports[comp_name] = bundles[bundle_key]
-
-    return imports
+def parse_lazy_imports(registry_ts_path):
+    """Map ComponentName -> import path from lazy() calls."""
+    return _registry_ts(registry_ts_path).lazy_imports
 
 
 def parse_card_type_to_component(registry_ts_path):
     """Map card_type -> ComponentName from RAW_CARD_COMPONENTS."""
-    with open(registry_ts_path) as f:
-        content = f.read()
-
-    mapping = {}
-    in_block = False
-    for line in content.split("\n"):
-        if "RAW_CARD_COMPONENTS" in line and "{" in line:
-            in_block = True
-            continue
-        if in_block and line.strip() == "}":
-            break
-        if in_block:
-            stripped = line.strip()
-            if stripped.startswith("//"):
-                continue
-            m = re.match(r"\s+(\w+):\s*(\w+)", line)
-            if m:
-                mapping[m.group(1)] = m.group(2)
-
-    return mapping
+    return _registry_ts(registry_ts_path).type_to_component
 
 
 # ── Static validation checks ────────────────────────────────────────
 
 def check_json_syntax(base, results):
     """Validate all JSON files parse correctly."""
-    patterns = ["registry.json", "presets/*.json", "card-presets/*.json",
-                "dashboards/*/dashboard.json", "themes/*.json"]
-    files = find_json_files(base, patterns)
+    files = _marketplace_files(base, *MARKETPLACE_JSON_KINDS)
 
-    for f in files:
+    for f, rel in files:
         data, err = load_json(f)
-        rel = os.path.relpath(f, base)
         if err:
             results.error("json-syntax", f"`{rel}`: {err}")
         else:
@@ -248,11 +466,10 @@ def check_json_syntax(base, results):
 
 def check_preset_schema(base, results):
     """Validate card preset format."""
-    files = find_json_files(base, ["presets/*.json", "card-presets/*.json"])
+    files = _marketplace_files(base, "presets", "card-presets")
 
-    for f in files:
+    for f, rel in files:
         data, err = load_json(f)
-        rel = os.path.relpath(f, base)
         if err:
             continue  # Already caught by json-syntax
 
@@ -267,13 +484,16 @@ def check_preset_schema(base, results):
             results.error("preset-schema", f"`{rel}`: missing or empty 'title'")
 
 
+# Width of the console dashboard grid; a card's x + w must not exceed it
+DASHBOARD_GRID_COLUMNS = 12
+
+
 def check_dashboard_schema(base, results):
     """Validate dashboard format and grid positions."""
-    files = find_json_files(base, ["dashboards/*/dashboard.json"])
+    files = _marketplace_files(base, "dashboards")
 
-    for f in files:
+    for f, rel in files:
         data, err = load_json(f)
-        rel = os.path.relpath(f, base)
         if err:
             continue
 
@@ -306,30 +526,34 @@ def check_dashboard_schema(base, results):
             x = pos.get("x", 0)
             w = pos.get("w", 0)
             if isinstance(x, (int, float)) and isinstance(w, (int, float)):
-                if x + w > 12:
+                right = x + w
+                if right > DASHBOARD_GRID_COLUMNS:
                     results.error("dashboard-grid",
                                  f"`{rel}` cards[{i}] ({card.get('card_type', '?')}): "
-                                 f"x({x}) + w({w}) = {x+w} > 12 (grid overflow)")
+                                 f"x({x}) + w({w}) = {right} > {DASHBOARD_GRID_COLUMNS} "
+                                 f"(grid overflow)")
+
+
+# Theme schema, built once. Tuples keep the reported order stable across
+# runs (set iteration order depends on string hashing).
+THEME_REQUIRED_TOP = ("id", "name", "dark")
+THEME_REQUIRED_COLORS = (
+    "background", "foreground", "card", "primary", "secondary",
+    "muted", "accent", "destructive", "border", "input", "ring",
+)
+THEME_REQUIRED_BRAND = ("brandPrimary",)
 
 
 def check_theme_schema(base, results):
     """Validate theme JSON structure."""
-    files = find_json_files(base, ["themes/*.json"])
-
-    required_top = {"id", "name", "dark"}
-    required_colors = {
-        "background", "foreground", "card", "primary", "secondary",
-        "muted", "accent", "destructive", "border", "input", "ring",
-    }
-    required_brand = {"brandPrimary"}
+    files = _marketplace_files(base, "themes")
 
-    for f in files:
+    for f, rel in files:
         data, err = load_json(f)
-        rel = os.path.relpath(f, base)
         if err:
             continue
 
-        for key in required_top:
+        for key in THEME_REQUIRED_TOP:
             if key not in data:
                 results.error("theme-schema", f"`{rel}`: missing required key '{key}'")
 
@@ -338,11 +562,11 @@ def check_theme_schema(base, results):
             results.error("theme-schema", f"`{rel}`: 'colors' must be an object")
             continue
 
-        for key in required_colors:
+        for key in THEME_REQUIRED_COLORS:
             if key not in colors:
                 results.error("theme-schema", f"`{rel}`: colors missing '{key}'")
 
-        for key in required_brand:
+        for key in THEME_REQUIRED_BRAND:
             if key not in colors:
                 results.warn("theme-schema", f"`{rel}`: colors missing '{key}'")
 
@@ -361,11 +585,9 @@ def check_theme_schema(base, results):
 
 def check_naming_conventions(base, results):
     """All card_type values must use snake_case (underscores, not hyphens)."""
-    files = find_json_files(base, ["presets/*.json", "card-presets/*.json",
-                                    "dashboards/*/dashboard.json"])
-    for f in files:
+    files = _marketplace_files(base, "presets", "card-presets", "dashboards")
+    for f, rel in files:
         data, err = load_json(f)
-        rel = os.path.relpath(f, base)
         if err:
             continue
 
@@ -385,6 +607,10 @@ def check_naming_conventions(base, results):
                              f"must be snake_case: '{suggested}'")
 
 
+# Repo-relative path of a raw.githubusercontent.com/.../main/<path> URL
+_MAIN_URL_RE = re.compile(r"/main/(.+)$")
+
+
 def check_registry_consistency(base, results):
     """Validate registry.json entries match actual files."""
     data, err = load_json(os.path.join(base, "registry.json"))
@@ -394,6 +620,7 @@ def check_registry_consistency(base, results):
 
     items = data.get("items", [])
     seen_ids = set()
+    relpaths = _scan_marketplace(base).relpaths
 
     for item in items:
         item_id = item.get("id", "<no-id>")
@@ -406,24 +633,19 @@ def check_registry_consistency(base, results):
 
         # File existence check based on type
         if item_type == "dashboard":
-            expected = os.path.join(base, "dashboards", item_id, "dashboard.json")
-            if not os.path.isfile(expected):
+            if not _marketplace_has_file(relpaths, base, f"dashboards/{item_id}/dashboard.json"):
                 results.error("registry",
                              f"Registry entry '{item_id}' (dashboard) has no file at "
                              f"dashboards/{item_id}/dashboard.json")
         elif item_type == "card-preset":
             # Could be in presets/ or card-presets/
-            candidates = [
-                os.path.join(base, "presets", f"{item_id}.json"),
-                os.path.join(base, "card-presets", f"{item_id}.json"),
-            ]
-            if not any(os.path.isfile(c) for c in candidates):
+            candidates = [f"presets/{item_id}.json", f"card-presets/{item_id}.json"]
+            if not any(_marketplace_has_file(relpaths, base, c) for c in candidates):
                 results.error("registry",
                              f"Registry entry '{item_id}' (card-preset) has no file in "
                              f"presets/ or card-presets/")
         elif item_type == "theme":
-            expected = os.path.join(base, "themes", f"{item_id}.json")
-            if not os.path.isfile(expected):
+            if not _marketplace_has_file(relpaths, base, f"themes/{item_id}.json"):
                 results.error("registry",
                              f"Registry entry '{item_id}' (theme) has no file at "
                              f"themes/{item_id}.json")
@@ -432,10 +654,10 @@ def check_registry_consistency(base, results):
         url = item.get("downloadUrl", "")
         if url:
             # Extract path after /main/
-            m = re.search(r"/main/(.+)$", url)
+            m = _MAIN_URL_RE.search(url)
             if m:
                 url_path = m.group(1)
-                if not os.path.isfile(os.path.join(base, url_path)):
+                if not _marketplace_has_file(relpaths, base, url_path):
                     results.error("registry",
                                  f"Registry '{item_id}': downloadUrl path '{url_path}' "
                                  f"does not match any file")
@@ -448,9 +670,8 @@ def check_registry_consistency(base, results):
 def get_all_marketplace_card_types(base):
     """Collect all card_type values referenced in marketplace JSON."""
     card_types = set()
-    files = find_json_files(base, ["presets/*.json", "card-presets/*.json",
-                                    "dashboards/*/dashboard.json"])
-    for f in files:
+    files = _marketplace_files(base, "presets", "card-presets", "dashboards")
+    for f, _ in files:
         data, err = load_json(f)
         if err:
             continue
@@ -492,13 +713,84 @@ def check_card_type_existence(base, console_path, results):
     return known
 
 
-def check_demo_data(base, console_path, known_types, results):
-    """Check that each known card_type has a demoData.ts file in console."""
-    registry_ts = os.path.join(console_path, "web/src/components/cards/cardRegistry.ts")
-    type_to_comp = parse_card_type_to_component(registry_ts)
-    lazy_imports = parse_lazy_imports(registry_ts)
-    cards_dir = os.path.join(console_path, "web/src/components/cards")
+# isDemoData passed to either card state hook, e.g. useCardLoadingState({ isDemoData })
+_IS_DEMO_DATA_RE = re.compile(r"(?:useCardLoadingState|useReportCardDataState)\([^)]*isDemoData")
+_USE_CACHED_RE = re.compile(r"useCached\w+")
 
+ComponentAudit = namedtuple("ComponentAudit", [
+    "card_type", "comp_name", "comp_dir", "has_demo_data", "loading_state",
+    "is_demo_data", "uses_cached", "consecutive_failures",
+])
+
+
+def _scan_component_dir(comp_dir):
+    """List a component directory with a single scandir.
+
+    Returns (has_demo_data, source_files): whether demoData.ts[x] exists,
+    and the paths of the .ts/.tsx sources other than tests and demo data.
+    """
+    has_demo_data = False
+    source_files = []
+    with os.scandir(comp_dir) as it:
+        for e in it:
+            name = e.name
+            if name.startswith(".") or not name.endswith((".ts", ".tsx")) or not e.is_file():
+                continue
+            if name in ("demoData.ts", "demoData.tsx"):
+                has_demo_data = True
+            if name.endswith((".test.ts", ".test.tsx")) or "demoData" in name:
+                continue
+            source_files.append(e.path)
+    return has_demo_data, source_files
+
+
+def _scan_component_sources(comp_dir):
+    """Read a component directory's sources once and probe them.
+
+    Cheap substring probes gate the regex searches so most files never
+    reach the regex engine.
+    Returns the (has_demo_data, loading_state, is_demo_data, uses_cached,
+    consecutive_failures) fields of a ComponentAudit, or None when
+    comp_dir is not a readable directory.
+    """
+    try:
+        has_demo_data, source_files = _scan_component_dir(comp_dir)
+    except OSError:
+        return None
+
+    loading_state = False
+    is_demo_data = False
+    uses_cached = False
+    failures = False
+
+    for path in source_files:
+        try:
+            with open(path) as f:
+                content = f.read()
+        except Exception:
+            continue
+
+        if "useCardLoadingState" in content:
+            loading_state = True
+            if "isDemoData" in content and _IS_DEMO_DATA_RE.search(content):
+                is_demo_data = True
+        if "useCached" in content and _USE_CACHED_RE.search(content):
+            uses_cached = True
+        if "consecutiveFailures" in content:
+            failures = True
+
+    return has_demo_data, loading_state, is_demo_data, uses_cached, failures
+
+
+def _audit_component_files(cards_dir, known_types, type_to_comp, lazy_imports):
+    """Scan each known card's component directory once.
+
+    Returns a ComponentAudit per card type that maps to a component
+    directory, in sorted card_type order. Card types served by the same
+    directory (a bundle) share one scan.
+    """
+    audits = []
+    scanned = {}  # comp_dir -> flags from _scan_component_sources, or None
     for ct in sorted(known_types):
         comp_name = type_to_comp.get(ct)
         if not comp_name:
@@ -508,122 +800,103 @@ def check_demo_data(base, console_path, known_types, results):
         if not import_path:
             continue
 
-        # Check for demoData.ts in the component directory
-        # import_path could be "./PodIssues" or "./deploy-bundle"
+        # import_path could be "./PodIssues" or "./deploy-bundle"; single-file
+        # components (not directories) are not audited
         comp_dir = os.path.join(cards_dir, import_path)
-        demo_files = [
-            os.path.join(comp_dir, "demoData.ts"),
-            os.path.join(comp_dir, "demoData.tsx"),
-        ]
+        if comp_dir not in scanned:
+            scanned[comp_dir] = _scan_component_sources(comp_dir)
+        flags = scanned[comp_dir]
+        if flags is None:
+            continue
 
-        # Also check if it's a single file (not directory)
-        if os.path.isdir(comp_dir):
-            if any(os.path.isfile(df) for df in demo_files):
-                results.ok("demo-data", f"`{ct}` has demoData.ts")
-            else:
-                results.warn("demo-data", f"`{ct}` ({comp_name}) missing demoData.ts "
-                            f"in {os.path.relpath(comp_dir, console_path)}")
+        audits.append(ComponentAudit(ct, comp_name, comp_dir, *flags))
+    return audits
 
 
-def check_is_demo_data_wiring(base, console_path, known_types, results):
-    """Check that card components wire isDemoData through useCardLoadingState."""
+def check_card_components(base, console_path, known_types, results):
+    """Check each known card's component directory in console: demoData.ts
+    present, isDemoData wired through useCardLoadingState, and
+    consecutiveFailures forwarded."""
     registry_ts = os.path.join(console_path, "web/src/components/cards/cardRegistry.ts")
     type_to_comp = parse_card_type_to_component(registry_ts)
     lazy_imports = parse_lazy_imports(registry_ts)
     cards_dir = os.path.join(console_path, "web/src/components/cards")
 
-    for ct in sorted(known_types):
-        comp_name = type_to_comp.get(ct)
-        if not comp_name:
-            continue
+    audits = _audit_component_files(cards_dir, known_types, type_to_comp, lazy_imports)
 
-        import_path = lazy_imports.get(comp_name)
-        if not import_path:
-            continue
+    for a in audits:
+        if a.has_demo_data:
+            results.ok("demo-data", f"`{a.card_type}` has demoData.ts")
+        else:
+            results.warn("demo-data", f"`{a.card_type}` ({a.comp_name}) missing demoData.ts "
+                        f"in {os.path.relpath(a.comp_dir, console_path)}",
+                        card_type=a.card_type)
 
-        comp_dir = os.path.join(cards_dir, import_path)
-        if not os.path.isdir(comp_dir):
-            continue
+    for a in audits:
+        if a.loading_state and not a.is_demo_data:
+            results.warn("isDemoData",
+                        f"`{a.card_type}` ({a.comp_name}) calls useCardLoadingState but "
+                        f"does not pass isDemoData", card_type=a.card_type)
 
-        # Read the main component file (index.ts/tsx or ComponentName.tsx)
-        main_files = glob.glob(os.path.join(comp_dir, "*.tsx")) + \
-                     glob.glob(os.path.join(comp_dir, "*.ts"))
+    for a in audits:
+        if a.uses_cached and not a.consecutive_failures:
+            results.warn("consecutiveFailures",
+                        f"`{a.card_type}` ({a.comp_name}) uses useCached* hook but does not "
+                        f"reference consecutiveFailures", card_type=a.card_type)
 
-        found_loading_state = False
-        has_is_demo_data = False
 
-        for mf in main_files:
-            if mf.endswith(".test.tsx") or mf.endswith(".test.ts"):
-                continue
-            if "demoData" in os.path.basename(mf):
-                continue
-            try:
-                with open(mf) as f:
-                    content = f.read()
-            except Exception:
-                continue
+def _has_key_with_prefix(sorted_keys, prefix):
+    """True if any key in the sorted list starts with prefix."""
+    i = bisect.bisect_left(sorted_keys, prefix)
+    return i < len(sorted_keys) and sorted_keys[i].startswith(prefix)
 
-            if "useCardLoadingState" in content:
-                found_loading_state = True
-                # Check if isDemoData is passed
-                if re.search(r"useCardLoadingState\([^)]*isDemoData", content):
-                    has_is_demo_data = True
-                # Also check useReportCardDataState pattern
-                if re.search(r"useReportCardDataState\([^)]*isDemoData", content):
-                    has_is_demo_data = True
 
-        if found_loading_state and not has_is_demo_data:
-            results.warn("isDemoData",
-                        f"`{ct}` ({comp_name}) calls useCardLoadingState but "
-                        f"does not pass isDemoData")
+def _flatten_i18n_keys(data):
+    """Dotted leaf keys plus the top-level keys of a (nested) cards.json."""
+    keys = set()
 
+    def flatten(obj, prefix=""):
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                flatten(v, f"{prefix}{k}." if prefix else f"{k}.")
+        else:
+            keys.add(prefix.rstrip("."))
 
-def check_consecutive_failures(base, console_path, known_types, results):
-    """Check that card components forward consecutiveFailures."""
-    registry_ts = os.path.join(console_path, "web/src/components/cards/cardRegistry.ts")
-    type_to_comp = parse_card_type_to_component(registry_ts)
-    lazy_imports = parse_lazy_imports(registry_ts)
-    cards_dir = os.path.join(console_path, "web/src/components/cards")
-
-    for ct in sorted(known_types):
-        comp_name = type_to_comp.get(ct)
-        if not comp_name:
-            continue
+    flatten(data)
+    if isinstance(data, dict):
+        keys.update(data.keys())
+    return keys
 
-        import_path = lazy_imports.get(comp_name)
-        if not import_path:
-            continue
 
-        comp_dir = os.path.join(cards_dir, import_path)
-        if not os.path.isdir(comp_dir):
-            continue
+def _load_i18n_keys(path):
+    """Return (flattened keys of a cards.json, error_msg).
 
-        main_files = glob.glob(os.path.join(comp_dir, "*.tsx")) + \
-                     glob.glob(os.path.join(comp_dir, "*.ts"))
+    The flattened keys are cached on disk, one cache file per cards.json
+    path, and reused while the file's SHA-256 is unchanged — CI re-runs
+    against the same console checkout skip the parse and flatten.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None, f"File not found: {path}"
 
-        uses_cached = False
-        has_failures = False
+    import hashlib  # cross-repo only
 
-        for mf in main_files:
-            if mf.endswith(".test.tsx") or mf.endswith(".test.ts"):
-                continue
-            if "demoData" in os.path.basename(mf):
-                continue
-            try:
-                with open(mf) as f:
-                    content = f.read()
-            except Exception:
-                continue
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_name = "i18n-" + hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:16] + ".json"
+    cached = _read_cache_file(cache_name)
+    if isinstance(cached, dict) and cached.get("sha256") == digest:
+        return set(cached.get("keys", ())), None
 
-            if re.search(r"useCached\w+", content):
-                uses_cached = True
-            if "consecutiveFailures" in content:
-                has_failures = True
+    try:
+        data = _json_loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return None, f"Invalid JSON: {e}"
 
-        if uses_cached and not has_failures:
-            results.warn("consecutiveFailures",
-                        f"`{ct}` ({comp_name}) uses useCached* hook but does not "
-                        f"reference consecutiveFailures")
+    keys = _flatten_i18n_keys(data)
+    _write_cache_file(cache_name, {"sha256": digest, "keys": sorted(keys)})
+    return keys, None
 
 
 def check_i18n_keys(base, console_path, known_types, results):
@@ -635,24 +908,14 @@ def check_i18n_keys(base, console_path, known_types, results):
         results.warn("i18n", "Console cards.json not found — skipping i18n check")
         return
 
-    # Flatten keys — cards.json may be nested
     all_keys = set()
 
-    def flatten(obj, prefix=""):
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                flatten(v, f"{prefix}{k}." if prefix else f"{k}.")
-        else:
-            all_keys.add(prefix.rstrip("."))
-
     def load_keys_from(path):
-        data, err = load_json(path)
+        keys, err = _load_i18n_keys(path)
         if err:
             results.warn("i18n", f"Failed to parse {os.path.basename(path)}: {err}")
             return
-        flatten(data)
-        if isinstance(data, dict):
-            all_keys.update(data.keys())
+        all_keys.update(keys)
 
     if os.path.isfile(cards_json_path):
         load_keys_from(cards_json_path)
@@ -662,12 +925,54 @@ def check_i18n_keys(base, console_path, known_types, results):
     if os.path.isfile(marketplace_cards_json_path):
         load_keys_from(marketplace_cards_json_path)
 
+    # Exact keys answer most lookups; prefix matches probe the sorted key
+    # list with bisect instead of scanning every key per card type.
+    sorted_keys = sorted(all_keys)
+
     for ct in sorted(known_types):
         # Check for the card_type as a key or prefix
-        has_key = any(k == ct or k.startswith(f"{ct}.") or k.startswith(f"{ct}_")
-                      for k in all_keys)
+        has_key = (ct in all_keys
+                   or _has_key_with_prefix(sorted_keys, f"{ct}.")
+                   or _has_key_with_prefix(sorted_keys, f"{ct}_"))
         if not has_key:
-            results.warn("i18n", f"`{ct}` has no translation keys in cards.json")
+            results.warn("i18n", f"`{ct}` has no translation keys in cards.json",
+                         card_type=ct)
+
+
+# Direct external fetch (not through proxy), as fetch('https://...') or
+# axios.get('https://...'). Both forms are one alternation so a file is
+# scanned once; the match is zero-width so that overlapping hits (e.g.
+# axios.fetch(...), which is both) are all found. The group name says
+# which form hit. (RE2 has no lookaround, so it cannot stand in here.)
+_CORS_RE = re.compile(
+    r"""(?=(?:(?P<fetch>fetch)|(?P<axios>axios\.\w+))"""
+    r"""\(\s*['"`]https?://(?!localhost|127\.0\.0\.1))""")
+_CORS_FORMS = ("fetch", "axios")
+
+
+def _source_files(root, suffixes=(".ts", ".tsx")):
+    """Sorted non-hidden files under root ending in one of suffixes.
+
+    One scandir per directory: DirEntry carries the file type, so no file
+    is stat'ed and the tree is walked once for all suffixes.
+    """
+    found = []
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    found.append(entry.path)
+    found.sort()
+    return found
 
 
 def check_cors_proxy(base, console_path, known_types, results):
@@ -684,66 +989,229 @@ def check_cors_proxy(base, console_path, known_types, results):
         results.warn("cors", "No hooks directory found — skipping CORS check")
         return
 
-    # Check for direct external fetch (not through proxy)
-    patterns = [
-        r"""fetch\(\s*['"`]https?://(?!localhost|127\.0\.0\.1)""",
-        r"""axios\.\w+\(\s*['"`]https?://(?!localhost|127\.0\.0\.1)""",
-    ]
-
     for hooks_dir, rel_root in scan_roots:
-        hook_files = glob.glob(os.path.join(hooks_dir, "**/*.ts"), recursive=True) + \
-                     glob.glob(os.path.join(hooks_dir, "**/*.tsx"), recursive=True)
-
-        for hf in hook_files:
+        for hf in _source_files(hooks_dir):
             try:
                 with open(hf) as f:
                     content = f.read()
             except Exception:
                 continue
 
+            # Both patterns need one of these literals; skip the regex
+            # engine for the (common) hook files that contain neither.
+            if "fetch(" not in content and "axios." not in content:
+                continue
+
             rel = os.path.relpath(hf, rel_root)
 
-            for pat in patterns:
-                matches = re.findall(pat, content)
-                if matches:
-                    results.warn("cors",
-                                f"`{rel}` contains direct external fetch — "
-                                f"should use backend proxy `/api/proxy/`")
+            found = set()
+            for m in _CORS_RE.finditer(content):
+                found.add(m.lastgroup)
+                if len(found) == len(_CORS_FORMS):
+                    break
+
+            # One warning per form found, as when each had its own pattern
+            for _ in found:
+                results.warn("cors",
+                            f"`{rel}` contains direct external fetch — "
+                            f"should use backend proxy `/api/proxy/`")
 
 
 # ── Nightly-only checks ─────────────────────────────────────────────
 
+# downloadUrl probing: concurrent HEAD requests over per-thread keep-alive
+# connections, one per scheme://host, going through the proxy named by the
+# http_proxy/https_proxy/no_proxy environment as urllib would. The network
+# modules are imported by the functions below rather than at module load —
+# only full mode needs them, and http.client (via email/ssl) dominates the
+# script's startup.
+DOWNLOAD_URL_WORKERS = 16
+DOWNLOAD_URL_TIMEOUT = 10
+DOWNLOAD_URL_MAX_REDIRECTS = 5
+
+_http_local = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme, netloc):
+    """The proxy URL (split) to reach scheme://netloc through, or None to
+    connect directly — per urllib's reading of the proxy environment."""
+    import urllib.parse
+    import urllib.request
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(netloc):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_auth_headers(proxy):
+    """Proxy-Authorization for credentials embedded in the proxy URL."""
+    if not proxy.username:
+        return {}
+    import base64
+    import urllib.parse
+    creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(creds.encode()).decode()}
+
+
+def _http_connection(scheme, netloc):
+    """Return this thread's pooled connection for scheme://netloc.
+
+    Through a proxy, https is tunnelled with CONNECT; plain http talks to
+    the proxy directly (see _head for the request form).
+    """
+    import http.client
+    conns = getattr(_http_local, "conns", None)
+    if conns is None:
+        conns = _http_local.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        if scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme '{scheme}'")
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        proxy = _proxy_for(scheme, netloc)
+        if proxy is None:
+            conn = cls(netloc, timeout=DOWNLOAD_URL_TIMEOUT)
+        else:
+            conn = cls(proxy.hostname, proxy.port or 80, timeout=DOWNLOAD_URL_TIMEOUT)
+            if scheme == "https":
+                conn.set_tunnel(netloc, headers=_proxy_auth_headers(proxy))
+        conns[(scheme, netloc)] = conn
+    return conn
+
+
+def _drop_connection(scheme, netloc):
+    conn = _http_local.conns.pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _head(url, headers):
+    """HEAD a URL, following redirects, and return the final response."""
+    import http.client
+    import urllib.parse
+    headers = {"User-Agent": "kc-marketplace-validator", **headers}
+    for _ in range(DOWNLOAD_URL_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        request_headers = headers
+        proxy = _proxy_for(parts.scheme, parts.netloc)
+        if proxy is not None and parts.scheme == "http":
+            # A plain-http proxy takes the absolute URL as the request target
+            path = urllib.parse.urlunsplit(parts._replace(path=path, query="", fragment=""))
+            request_headers = {**headers, **_proxy_auth_headers(proxy)}
+
+        # A kept-alive connection may have been closed by the server since
+        # its last use — retry once on a fresh one.
+        for retry in (False, True):
+            conn = _http_connection(parts.scheme, parts.netloc)
+            try:
+                conn.request("HEAD", path, headers=request_headers)
+                resp = conn.getresponse()
+                resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                _drop_connection(parts.scheme, parts.netloc)
+                if retry:
+                    raise
+            except Exception:
+                _drop_connection(parts.scheme, parts.netloc)
+                raise
+
+        location = resp.getheader("Location")
+        if resp.status not in (301, 302, 303, 307, 308) or not location:
+            break
+        url = urllib.parse.urljoin(url, location)
+
+    return resp
+
+
+def _probe_download_url(url, validators):
+    """HEAD a downloadUrl, conditionally if validators from a previous run
+    are known. Returns (status, new validators, exception); all None for an
+    empty URL."""
+    if not url:
+        return None, None, None
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    try:
+        resp = _head(url, headers)
+    except Exception as e:
+        return None, None, e
+
+    new_validators = None
+    if resp.status == 200:
+        new_validators = {"etag": resp.getheader("ETag"),
+                          "last_modified": resp.getheader("Last-Modified")}
+    return resp.status, new_validators, None
+
+
 def check_download_urls(base, results):
-    """HTTP HEAD to each downloadUrl in registry.json."""
+    """HTTP HEAD to each downloadUrl in registry.json.
+
+    ETag/Last-Modified validators from the last successful probe of each URL
+    are cached on disk and sent back as conditional headers; a 304 means the
+    file is still served unchanged.
+    """
     data, err = load_json(os.path.join(base, "registry.json"))
     if err:
         return
 
-    for item in data.get("items", []):
-        url = item.get("downloadUrl", "")
-        item_id = item.get("id", "?")
+    url_cache = _read_cache_file("urls.json")
+    if not isinstance(url_cache, dict):
+        url_cache = {}
+
+    probes = [(item.get("id", "?"), item.get("downloadUrl", ""))
+              for item in data.get("items", [])]
+    urls = [url for _, url in probes]
+    validators = [url_cache.get(url) or {} for url in urls]
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_URL_WORKERS) as executor:
+        outcomes = list(executor.map(_probe_download_url, urls, validators))
+
+    # Report in registry order regardless of completion order
+    for (item_id, url), (status, new_validators, exc) in zip(probes, outcomes):
         if not url:
             results.warn("download-url", f"'{item_id}' has no downloadUrl")
-            continue
+        elif exc is not None:
+            results.warn("download-url",
+                        f"'{item_id}' URL unreachable: {exc}")
+        elif status == 200:
+            results.ok("download-url", f"'{item_id}' URL OK (200)")
+        elif status == 304 and url in url_cache:
+            results.ok("download-url", f"'{item_id}' URL OK (304 not modified)")
+        elif 200 < status < 300:
+            results.warn("download-url",
+                        f"'{item_id}' URL returned {status}: {url}")
+        else:
+            results.error("download-url",
+                         f"'{item_id}' URL returned {status}: {url}")
 
-        try:
-            req = urllib.request.Request(url, method="HEAD")
-            resp = urllib.request.urlopen(req, timeout=10)
-            if resp.status == 200:
-                results.ok("download-url", f"'{item_id}' URL OK (200)")
+        if new_validators is not None:
+            if new_validators["etag"] or new_validators["last_modified"]:
+                url_cache[url] = new_validators
             else:
-                results.warn("download-url",
-                            f"'{item_id}' URL returned {resp.status}: {url}")
-        except urllib.error.HTTPError as e:
-            results.error("download-url",
-                         f"'{item_id}' URL returned {e.code}: {url}")
-        except Exception as e:
-            results.warn("download-url",
-                        f"'{item_id}' URL unreachable: {e}")
+                url_cache.pop(url, None)
+        elif url and status != 304:
+            # Anything other than a confirmed-unchanged file invalidates
+            url_cache.pop(url, None)
+
+    _write_cache_file("urls.json", url_cache)
 
 
 def check_registry_staleness(base, results):
     """Check that registry.json updatedAt is within 30 days."""
+    from datetime import datetime, timezone, timedelta
+
     data, err = load_json(os.path.join(base, "registry.json"))
     if err:
         return
@@ -768,15 +1236,14 @@ def check_registry_staleness(base, results):
 
 def check_theme_consistency(base, results):
     """All themes must define the same set of color keys."""
-    files = find_json_files(base, ["themes/*.json"])
+    files = _marketplace_files(base, "themes")
     if len(files) < 2:
         results.note("theme-consistency", "Only one theme found — nothing to compare")
         return
 
     theme_keys = {}
-    for f in sorted(files):
+    for f, rel in files:
         data, err = load_json(f)
-        rel = os.path.relpath(f, base)
         if err:
             continue
         colors = data.get("colors", {})
@@ -808,9 +1275,11 @@ def check_cncf_coverage(base, console_path, results):
     if os.path.isfile(registry_ts):
         console_types = parse_card_registry(registry_ts)
 
-    cncf_files = find_json_files(base, ["presets/cncf-*.json"])
+    cncf_files = [f for f, _ in _marketplace_files(base, "presets")
+                  if os.path.basename(f).startswith("cncf-")]
     missing = []
     for f in cncf_files:
+        # Already parsed by preload_all(), so this is a cache hit
         data, err = load_json(f)
         if err:
             continue
@@ -829,8 +1298,23 @@ def check_cncf_coverage(base, console_path, results):
 
 # ── Card quality summary table ───────────────────────────────────────
 
+# Result categories behind the demo_data/isDemoData/failures/i18n columns,
+# in column order
+QUALITY_TABLE_CATEGORIES = ("demo-data", "isDemoData", "consecutiveFailures", "i18n")
+QUALITY_TABLE_HEADER = (
+    "### Card Quality Matrix\n"
+    "\n"
+    "| card_type | in_console | demo_data | isDemoData | failures | i18n |\n"
+    "|-----------|:----------:|:---------:|:----------:|:--------:|:----:|\n"
+)
+QUALITY_TABLE_FOOTER = (
+    "\n"
+    "Key: Y=pass, N=issue found, ~=dynamic card (expected), -=not applicable\n"
+)
+
+
 def generate_quality_table(base, console_path, known_types, results):
-    """Generate markdown summary table for card quality."""
+    """Generate markdown summary table for card quality (newline-terminated)."""
     if not console_path:
         return ""
 
@@ -839,38 +1323,54 @@ def generate_quality_table(base, console_path, known_types, results):
         return ""
 
     console_types = parse_card_registry(registry_ts)
+    if not console_types:
+        return ""  # nothing parsed from the registry, so every row would be blank
     marketplace_types = get_all_marketplace_card_types(base)
 
-    lines = [
-        "### Card Quality Matrix",
-        "",
-        "| card_type | in_console | demo_data | isDemoData | failures | i18n |",
-        "|-----------|:----------:|:---------:|:----------:|:--------:|:----:|",
-    ]
+    # Card types flagged in each column's category, in column order — one
+    # set probe per cell, with no (category, card_type) key built per row
+    column_flags = [{ct for cat, ct in results.flagged if cat == column}
+                    for column in QUALITY_TABLE_CATEGORIES]
 
-    # Collect results by card_type
-    for ct in sorted(marketplace_types):
-        exists = "Y" if ct in console_types else ("~" if ct.endswith("_status") else "N")
+    def rows():
+        for ct in sorted(marketplace_types):
+            if ct in console_types:
+                exists = present = "Y"
+            else:
+                exists = "~" if ct.endswith("_status") else "N"
+                present = "-"
 
-        # Check for related warnings/errors in results
-        def has_issue(category):
-            return any(ct in msg for cat, msg in results.warnings + results.errors
-                      if cat == category)
+            cells = " | ".join("N" if ct in flags else present for flags in column_flags)
+            yield f"| `{ct}` | {exists} | {cells} |\n"
 
-        demo = "N" if has_issue("demo-data") else ("Y" if ct in console_types else "-")
-        is_demo = "N" if has_issue("isDemoData") else ("Y" if ct in console_types else "-")
-        failures = "N" if has_issue("consecutiveFailures") else \
-                   ("Y" if ct in console_types else "-")
-        i18n = "N" if has_issue("i18n") else ("Y" if ct in console_types else "-")
+    # One join over the rows, between fixed header and footer text
+    return QUALITY_TABLE_HEADER + "".join(rows()) + QUALITY_TABLE_FOOTER
 
-        lines.append(f"| `{ct}` | {exists} | {demo} | {is_demo} | {failures} | {i18n} |")
 
-    lines.append("")
-    lines.append("Key: Y=pass, N=issue found, ~=dynamic card (expected), -=not applicable")
-    return "\n".join(lines)
+# ── Main ─────────────────────────────────────────────────────────────
 
+MAX_CHECK_WORKERS = 6
+
+
+def run_checks(results, checks):
+    """Run independent checks concurrently and merge their findings.
+
+    Each entry is (check_fn, *args); the check is called as
+    check_fn(*args, results) with its own Results, and those are merged
+    into `results` in list order — the same output as running the checks
+    one after another. The checks are I/O-heavy (stat, read, HTTP), so
+    threads overlap their waits.
+    """
+    def run(check):
+        fn, *args = check
+        own = Results()
+        fn(*args, own)
+        return own
+
+    with ThreadPoolExecutor(max_workers=MAX_CHECK_WORKERS) as executor:
+        for own in executor.map(run, checks):
+            results.merge(own)
 
-# ── Main ─────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(description="Marketplace quality gate")
@@ -892,51 +1392,68 @@ def main():
 
     console_path = os.path.abspath(args.console_path) if args.console_path else None
 
-    # When --json is used, send verbose progress to stderr so stdout is clean JSON
-    log = (lambda msg: print(msg, file=sys.stderr)) if args.json else print
+    # Progress headings go to stdout with the report, or to stderr under
+    # --json so stdout stays pure JSON; one write per heading
+    progress = sys.stderr if args.json else sys.stdout
+
+    def log(msg):
+        progress.write(msg + "\n")
 
     # ── Static checks (all modes) ──
     log("=== Static Validation ===")
-    check_json_syntax(base, results)
-    check_preset_schema(base, results)
-    check_dashboard_schema(base, results)
-    check_theme_schema(base, results)
-    check_naming_conventions(base, results)
-    check_registry_consistency(base, results)
+    preload_all(base)
+    run_checks(results, [
+        (check_json_syntax, base),
+        (check_preset_schema, base),
+        (check_dashboard_schema, base),
+        (check_theme_schema, base),
+        (check_naming_conventions, base),
+        (check_registry_consistency, base),
+    ])
 
     # ── Cross-repo checks ──
     known_types = set()
     if args.mode in ("cross-repo", "full") and console_path:
         log("\n=== Cross-Repo Quality Checks ===")
+        # Everything else depends on the set of known card types
         known_types = check_card_type_existence(base, console_path, results)
-        check_demo_data(base, console_path, known_types, results)
-        check_is_demo_data_wiring(base, console_path, known_types, results)
-        check_consecutive_failures(base, console_path, known_types, results)
-        check_i18n_keys(base, console_path, known_types, results)
-        check_cors_proxy(base, console_path, known_types, results)
+        run_checks(results, [
+            (check_card_components, base, console_path, known_types),
+            (check_i18n_keys, base, console_path, known_types),
+            (check_cors_proxy, base, console_path, known_types),
+        ])
 
     # ── Nightly-only checks ──
     if args.mode == "full":
         log("\n=== Nightly Checks ===")
-        check_download_urls(base, results)
-        check_registry_staleness(base, results)
-        check_theme_consistency(base, results)
+        nightly = [
+            (check_download_urls, base),
+            (check_registry_staleness, base),
+            (check_theme_consistency, base),
+        ]
         if console_path:
-            check_cncf_coverage(base, console_path, results)
+            nightly.append((check_cncf_coverage, base, console_path))
+        run_checks(results, nightly)
 
     # ── Output ──
     if args.json:
-        print(json.dumps(results.to_json(), indent=2))
+        sys.stdout.flush()
+        # Two writes into the buffered stream rather than copying the report
+        # to tack a newline on
+        sys.stdout.buffer.write(_json_dumps_pretty(results.to_json()))
+        sys.stdout.buffer.write(b"\n")
     else:
         results.print_summary()
 
     if args.github_summary:
-        with open(args.github_summary, "a") as f:
-            f.write(results.summary_md())
-            if args.mode in ("cross-repo", "full") and console_path:
-                table = generate_quality_table(base, console_path, known_types, results)
-                if table:
-                    f.write("\n" + table + "\n")
+        parts = [results.summary_md()]
+        if args.mode in ("cross-repo", "full") and console_path:
+            table = generate_quality_table(base, console_path, known_types, results)
+            if table:
+                parts += ["\n", table]
+        # One append for the whole report; UTF-8 regardless of locale
+        with open(args.github_summary, "ab") as f:
+            f.write("".join(parts).encode())
 
     sys.exit(results.exit_code)
 